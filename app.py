@@ -12,24 +12,31 @@ import os
 from pathlib import Path
 import streamlit as st
 
-# Set page configuration - MUST be the first Streamlit command
-st.set_page_config(
-    page_title="Markdown Converter UI",
-    page_icon="📝",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
-
 # Add the project root to Python path
 project_root = Path(__file__).parent.absolute()
 sys.path.append(str(project_root))
 
 # Try to import from src module, with fallback handling
 try:
+    from src.config import PAGE_TITLE, PAGE_ICON, LAYOUT, SIDEBAR_STATE
     from src.main import main
     from src.utils.cleanup import start_cleanup_thread
+    import_error = None
 except ImportError as e:
-    st.error(f"Error importing modules: {str(e)}")
+    # Page configuration still has to come first, so fall back to the defaults
+    PAGE_TITLE, PAGE_ICON, LAYOUT, SIDEBAR_STATE = "Markdown Converter UI", "📝", "wide", "expanded"
+    import_error = e
+
+# Set page configuration - MUST be the first Streamlit command
+st.set_page_config(
+    page_title=PAGE_TITLE,
+    page_icon=PAGE_ICON,
+    layout=LAYOUT,
+    initial_sidebar_state=SIDEBAR_STATE
+)
+
+if import_error is not None:
+    st.error(f"Error importing modules: {str(import_error)}")
     st.write("Make sure you're running from the correct directory and all dependencies are installed.")
     st.info("Run: pip install -r requirements.txt")
     st.info("Current working directory: " + os.getcwd())
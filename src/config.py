@@ -4,6 +4,7 @@ Configuration and constants for the Markdown Converter UI.
 
 import os
 import tempfile
+import threading
 import logging
 from pathlib import Path
 
@@ -20,15 +21,29 @@ FILE_EXPIRY_HOURS = 2  # Files will be deleted after this many hours
 TEMP_DIR = Path(tempfile.gettempdir()) / "markdown-converter-ui"
 TEMP_DIR.mkdir(exist_ok=True, parents=True)
 
-# Dictionary to track temporary files with their creation time
+# Cache directory for converted markdown, keyed by content hash
+CACHE_DIR = TEMP_DIR / "cache"
+CACHE_DIR.mkdir(exist_ok=True, parents=True)
+MEMORY_CACHE_ENTRIES = 64  # Converted documents also kept in process memory
+PROGRESS_STEP = 10  # Progress bars are redrawn in steps of this many percent
+
+# Dictionary to track temporary files with their creation time (epoch seconds)
 temp_files = {}
+# Min-heap of (expiry timestamp, path) entries for the tracked files
+expiry_heap = []
+# Guards temp_files and expiry_heap; notified whenever a file is tracked
+temp_files_lock = threading.Condition()
 
 # Streamlit configuration
 PAGE_TITLE = "Markdown Converter UI"
-PAGE_ICON = "📄"
+PAGE_ICON = "📝"
 LAYOUT = "wide"
 SIDEBAR_STATE = "expanded"
 
 # File types for uploader
-ACCEPTED_FILE_TYPES = ["docx", "html", "pdf", "txt", "md", "rtf"]
+ACCEPTED_FILE_TYPES = frozenset({"docx", "html", "pdf", "txt", "md", "rtf"})
+ACCEPTED_TYPES_SORTED = tuple(sorted(ACCEPTED_FILE_TYPES))
+ACCEPTED_TYPES_DISPLAY = ", ".join(f".{ext}" for ext in ACCEPTED_TYPES_SORTED)
 
+# File types that are already text and are shown without conversion
+PASSTHROUGH_FILE_TYPES = frozenset({"txt", "md"})
@@ -2,85 +2,193 @@
 Main application module for the Markdown Converter UI.
 """
 
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
-from src.config import logger, MAX_FILE_SIZE_MB
+from src.config import logger, MAX_FILE_SIZE_MB, PASSTHROUGH_FILE_TYPES, PROGRESS_STEP
 from src.utils.cleanup import start_cleanup_thread
-from src.utils.file_helpers import save_uploaded_file, get_output_filename
-from src.utils.markdown_converter import convert_to_markdown
+from src.utils.file_helpers import save_uploaded_file, get_output_filename, get_file_extension
+from src.utils.markdown_converter import convert_to_markdown, get_large_file_warning
+from src.utils.cache import get_cache_key, load_cached_markdown, store_cached_markdown
 from src.ui import components, styles
 from src.ui.layout import setup_layout
 
 
-def process_file(file, file_tab, conversion_options):
+def prepare_file(file, file_tab, conversion_options):
     """
-    Process a file for conversion to markdown.
+    Validate an uploaded file and prepare it for conversion.
 
     Args:
         file: The uploaded file to process
         file_tab: The tab where the file results will be displayed
         conversion_options (dict): Options for the markdown conversion
+
+    Returns:
+        tuple: (info_area, cache_key, markdown_content, temp_file_path). info_area holds
+            the file info banner; markdown_content is set for text files and cache hits,
+            otherwise temp_file_path points to the saved upload.
+        None: If the file was rejected or could not be saved
     """
     from src.utils.file_helpers import validate_file_type
-    from src.config import ACCEPTED_FILE_TYPES
+    from src.config import ACCEPTED_FILE_TYPES, ACCEPTED_TYPES_DISPLAY
 
     with file_tab:
-        # Display file info
-        components.file_info(file)
+        # Display file info; replaced by file info plus the success banner once converted
+        file_size = file.size
+        info_area = st.empty()
+        components.file_info(file, file_size, placeholder=info_area)
 
         # Validate file type
         if not validate_file_type(file.name, ACCEPTED_FILE_TYPES):
-            st.error(f"File type not supported. Please upload one of the following formats: {', '.join([f'.{ext}' for ext in ACCEPTED_FILE_TYPES])}")
-            return
+            st.error(f"File type not supported. Please upload one of the following formats: {ACCEPTED_TYPES_DISPLAY}")
+            return None
 
         # Check file size before processing
-        file_size = len(file.getvalue())
         if file_size > MAX_FILE_SIZE_MB * 1024 * 1024:
             st.error(f"File exceeds size limit of {MAX_FILE_SIZE_MB}MB. Your file is {file_size / (1024 * 1024):.1f}MB.")
-            return
-
-        # Save uploaded file to temp directory
-        temp_file_path = save_uploaded_file(file)
-        if not temp_file_path:
-            return
+            return None
 
         try:
-            # Create a progress bar and status indicators
-            progress_bar = st.progress(0)
-            status_text = st.empty()
+            # Text and markdown files are returned as-is, without MarkItDown or a temp file
+            file_ext = get_file_extension(file.name)
+            if file_ext in PASSTHROUGH_FILE_TYPES:
+                return info_area, None, file.getvalue().decode("utf-8", "replace"), None
+
+            # Reuse a previous conversion of the same content, extension and options
+            with file.getbuffer() as buffer:
+                cache_key = get_cache_key(buffer, file_ext, conversion_options)
+            markdown_content = load_cached_markdown(cache_key)
+            if markdown_content is not None:
+                return info_area, cache_key, markdown_content, None
+
+            # Save uploaded file to temp directory
+            temp_file_path = save_uploaded_file(file)
+            if not temp_file_path:
+                return None
+
+            return info_area, cache_key, None, temp_file_path
+        except Exception as e:
+            st.error(f"An error occurred: {str(e)}")
+            logger.exception("Error preparing file")
+            return None
 
-            # Update progress
-            status_text.text("Starting conversion...")
-            progress_bar.progress(25)
 
-            # Convert file to markdown
-            status_text.text("Converting to Markdown...")
-            markdown_content = convert_to_markdown(
-                temp_file_path,
-                options=conversion_options,
-                status_placeholder=status_text,
-                progress_bar=progress_bar
+def show_result(file, file_tab, info_area, markdown_content, error_msg=None):
+    """
+    Display the conversion result for a file.
+
+    Args:
+        file: The uploaded file that was converted
+        file_tab: The tab where the file results will be displayed
+        info_area (st.empty): Placeholder holding the file info banner
+        markdown_content (str): The converted markdown, or None if conversion failed
+        error_msg (str, optional): Why the conversion failed, shown instead of the generic error.
+            Defaults to None.
+    """
+    with file_tab:
+        if markdown_content:
+            # Generate output filename
+            output_filename = get_output_filename(file.name)
+
+            # Streamlit's upload id is stable across reruns, unlike id(file), so widget state is kept
+            widget_key = file.file_id
+
+            # Create action area with download button at top
+            components.success_action_area(
+                markdown_content,
+                output_filename,
+                key=f"download_{widget_key}",
+                file=file,
+                placeholder=info_area
             )
 
-            if markdown_content:
-                # Update progress
-                status_text.text("Conversion complete!")
-                progress_bar.progress(100)
+            # Display tabs for preview and raw markdown
+            components.preview_tabs(markdown_content, output_filename, widget_key)
+        else:
+            st.error(error_msg or "Failed to convert file. Please check if the file format is supported.")
 
-                # Generate output filename
-                output_filename = get_output_filename(file.name)
 
-                # Create action area with download button at top
-                components.success_action_area(markdown_content, output_filename)
+def process_files(uploaded_files, file_tabs, conversion_options):
+    """
+    Convert uploaded files to markdown concurrently.
+    Conversions run on a thread pool, while the script thread keeps the progress
+    bars moving and renders each result as soon as its conversion completes.
 
-                # Display tabs for preview and raw markdown
-                components.preview_tabs(markdown_content, output_filename, id(file))
-            else:
-                st.error("Failed to convert file. Please check if the file format is supported.")
+    Args:
+        uploaded_files (list): The uploaded files to process
+        file_tabs (list): The tabs where each file's results will be displayed
+        conversion_options (dict): Options for the markdown conversion
+    """
+    # Let worker threads use the session's script context (e.g. for cached resources)
+    ctx = get_script_run_ctx()
+    max_workers = min(len(uploaded_files), os.cpu_count() or 1)
+    pending = {}
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers,
+        initializer=lambda: add_script_run_ctx(threading.current_thread(), ctx)
+    ) as executor:
+        for file, file_tab in zip(uploaded_files, file_tabs):
+            prepared = prepare_file(file, file_tab, conversion_options)
+            if prepared is None:
+                continue
+
+            info_area, cache_key, markdown_content, temp_file_path = prepared
+            if markdown_content is not None:
+                show_result(file, file_tab, info_area, markdown_content)
+                continue
 
-        except Exception as e:
-            st.error(f"An error occurred: {str(e)}")
-            logger.exception("Error processing file")
+            # Create a progress bar and status indicators
+            with file_tab:
+                warning_msg = get_large_file_warning(file.size)
+                if warning_msg:
+                    st.warning(warning_msg)
+                progress_bar = st.progress(25)
+                status_text = st.empty()
+                status_text.text("Converting to Markdown...")
+
+            future = executor.submit(
+                convert_to_markdown,
+                temp_file_path,
+                conversion_options,
+                file_size=file.size
+            )
+            pending[future] = (file, file_tab, info_area, cache_key, progress_bar, status_text)
+
+        # Poll the running conversions, advancing their progress bars until each completes.
+        # Bars are only redrawn in PROGRESS_STEP increments, so most polls send nothing.
+        progress = dict.fromkeys(pending, 25)
+        shown = dict.fromkeys(pending, 25 - 25 % PROGRESS_STEP)
+        running = set(pending)
+        while running:
+            done, running = wait(running, timeout=0.2, return_when=FIRST_COMPLETED)
+
+            for future in running:
+                progress[future] = min(95, progress[future] + 2)
+                step = progress[future] - progress[future] % PROGRESS_STEP
+                if step != shown[future]:
+                    shown[future] = step
+                    pending[future][4].progress(step)
+
+            for future in done:
+                file, file_tab, info_area, cache_key, progress_bar, status_text = pending[future]
+                try:
+                    markdown_content, error_msg = future.result()
+                except Exception as e:
+                    markdown_content, error_msg = None, f"An error occurred: {str(e)}"
+                    logger.exception("Error processing file")
+
+                # The success banner or the error replaces the progress indicators
+                progress_bar.empty()
+                status_text.empty()
+                if markdown_content:
+                    store_cached_markdown(cache_key, markdown_content)
+
+                show_result(file, file_tab, info_area, markdown_content, error_msg)
 
 
 def main():
@@ -104,8 +212,7 @@ def main():
 
     # Process each file if any were uploaded
     if uploaded_files and file_tabs:
-        for i, file in enumerate(uploaded_files):
-            process_file(file, file_tabs[i], conversion_options)
+        process_files(uploaded_files, file_tabs, conversion_options)
 
     # Render footer
     components.footer()
@@ -7,6 +7,34 @@ import streamlit as st
 from src.config import ACCEPTED_FILE_TYPES, MAX_FILE_SIZE_MB
 from src.ui import components
 
+# Sidebar description; MAX_FILE_SIZE_MB is fixed for the process, so it is built once at import
+_SIDEBAR_MD = f"""
+This application transforms documents into clean, LLM-ready Markdown for AI workflows.
+
+### AI & LLM Integration
+- **Fine-tuning Data Prep**: Prepare training data for LLMs
+- **RAG Systems**: Create content for retrieval-augmented generation
+- **Knowledge Bases**: Build AI-ready documentation
+- **Prompt Engineering**: Extract structured content for prompts
+
+### Supported Formats
+- Word Documents (.docx)
+- PDF documents (.pdf)
+- PowerPoint (.pptx)
+- HTML files (.html)
+- Text files (.txt)
+- Markdown files (.md)
+- Rich Text Format (.rtf)
+- Images with OCR (.jpg, .png)
+- Audio transcription (.mp3, .wav)
+
+### How to Use
+1. Upload one or more files (max {MAX_FILE_SIZE_MB}MB per file)
+2. Convert to LLM-ready Markdown
+3. Preview the result
+4. Download and use with your AI tools
+"""
+
 
 def sidebar():
     """
@@ -19,34 +47,7 @@ def sidebar():
     with st.sidebar:
         st.header("About")
         # Display the information
-        st.markdown(
-            f"""
-            This application transforms documents into clean, LLM-ready Markdown for AI workflows.
-
-            ### AI & LLM Integration
-            - **Fine-tuning Data Prep**: Prepare training data for LLMs
-            - **RAG Systems**: Create content for retrieval-augmented generation
-            - **Knowledge Bases**: Build AI-ready documentation
-            - **Prompt Engineering**: Extract structured content for prompts
-
-            ### Supported Formats
-            - Word Documents (.docx)
-            - PDF documents (.pdf)
-            - PowerPoint (.pptx)
-            - HTML files (.html)
-            - Text files (.txt)
-            - Markdown files (.md)
-            - Rich Text Format (.rtf)
-            - Images with OCR (.jpg, .png)
-            - Audio transcription (.mp3, .wav)
-
-            ### How to Use
-            1. Upload one or more files (max {MAX_FILE_SIZE_MB}MB per file)
-            2. Convert to LLM-ready Markdown
-            3. Preview the result
-            4. Download and use with your AI tools
-            """
-        )
+        st.markdown(_SIDEBAR_MD)
 
         st.header("Settings")
         settings = {
@@ -0,0 +1,121 @@
+"""
+Content-addressed cache for converted markdown in the Markdown Converter UI.
+"""
+
+import os
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+
+from src.config import CACHE_DIR, MEMORY_CACHE_ENTRIES, logger
+from src.utils.cleanup import track_temp_file
+
+# Most recently used conversions, kept in memory in front of the disk cache
+_memory_cache = OrderedDict()
+_memory_cache_lock = threading.Lock()
+
+
+def get_cache_key(file_bytes, file_ext, options=None):
+    """
+    Build a cache key from the file contents, extension and conversion options.
+    MarkItDown picks its converter by extension, so the same bytes uploaded under
+    different extensions get separate entries.
+
+    Args:
+        file_bytes (bytes-like): The raw contents of the uploaded file, e.g. its getbuffer() view
+        file_ext (str): The lower-cased file extension, from get_file_extension
+        options (dict, optional): Conversion options. Defaults to None.
+
+    Returns:
+        str: Cache key combining the content digest and an options digest
+    """
+    options_repr = repr((file_ext, sorted((options or {}).items()))).encode()
+    content_digest = hashlib.blake2b(file_bytes, digest_size=16).hexdigest()
+    options_digest = hashlib.blake2b(options_repr).hexdigest()[:8]
+    return f"{content_digest}-{options_digest}"
+
+
+def _remember(key, markdown_content):
+    """
+    Keep a conversion in the in-memory cache, evicting the least recently used entries.
+
+    Args:
+        key (str): Cache key from get_cache_key
+        markdown_content (str): The converted markdown content
+    """
+    with _memory_cache_lock:
+        _memory_cache[key] = markdown_content
+        _memory_cache.move_to_end(key)
+        while len(_memory_cache) > MEMORY_CACHE_ENTRIES:
+            _memory_cache.popitem(last=False)
+
+
+def get_cache_path(key):
+    """
+    Get the path of the cache entry for a key.
+
+    Args:
+        key (str): Cache key from get_cache_key
+
+    Returns:
+        Path: Path to the cached markdown file
+    """
+    return CACHE_DIR / f"{key}.md"
+
+
+def load_cached_markdown(key):
+    """
+    Load previously converted markdown from the cache.
+    Recently used entries are served from memory before falling back to disk.
+
+    Args:
+        key (str): Cache key from get_cache_key
+
+    Returns:
+        str: The cached markdown content
+        None: If there is no cache entry for the key
+    """
+    with _memory_cache_lock:
+        markdown_content = _memory_cache.get(key)
+        if markdown_content is not None:
+            _memory_cache.move_to_end(key)
+            return markdown_content
+
+    try:
+        with open(get_cache_path(key), 'r', encoding='utf-8') as f:
+            markdown_content = f.read()
+        logger.info(f"Cache hit: {key}")
+        _remember(key, markdown_content)
+        return markdown_content
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.error(f"Error reading cache entry {key}: {str(e)}")
+        return None
+
+
+def store_cached_markdown(key, markdown_content):
+    """
+    Store converted markdown in the memory and disk caches.
+    The disk entry is written to a temporary file and moved into place atomically,
+    so concurrent readers never see a partially written entry.
+
+    Args:
+        key (str): Cache key from get_cache_key
+        markdown_content (str): The converted markdown content
+    """
+    _remember(key, markdown_content)
+
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(markdown_content)
+            os.replace(tmp_path, get_cache_path(key))
+        except Exception:
+            os.unlink(tmp_path)
+            raise
+        track_temp_file(str(get_cache_path(key)))
+    except Exception as e:
+        logger.error(f"Error writing cache entry {key}: {str(e)}")
@@ -4,72 +4,150 @@ Temporary file cleanup utilities for the Markdown Converter UI.
 
 import os
 import time
+import heapq
+import atexit
 import threading
-import datetime
 
-from src.config import TEMP_DIR, FILE_EXPIRY_HOURS, temp_files, logger
+from src.config import (
+    TEMP_DIR, CACHE_DIR, FILE_EXPIRY_HOURS, temp_files, expiry_heap, temp_files_lock, logger
+)
+
+# Background cleanup thread, shared by all sessions
+_cleanup_thread = None
+_cleanup_thread_lock = threading.Lock()
+_cleanup_stop = threading.Event()
+_atexit_registered = False
+
+
+def track_temp_file(file_path, creation_time=None):
+    """
+    Track a temporary file so it is deleted once it expires.
+    
+    Args:
+        file_path (str): Path to the temporary file
+        creation_time (float, optional): Creation time in epoch seconds. If None, uses time.time().
+    """
+    if creation_time is None:
+        creation_time = time.time()
+    with temp_files_lock:
+        temp_files[file_path] = creation_time
+        heapq.heappush(expiry_heap, (creation_time + FILE_EXPIRY_HOURS * 3600, file_path))
+        temp_files_lock.notify()
+
+
+def remove_expired_files():
+    """
+    Delete tracked files whose expiry time has passed.
+    Only the expired entries at the top of the expiry heap are visited.
+    
+    Returns:
+        int: Number of expired files removed from tracking
+    """
+    now = time.time()
+    files_to_remove = []
+    with temp_files_lock:
+        while expiry_heap and expiry_heap[0][0] <= now:
+            _, file_path = heapq.heappop(expiry_heap)
+            temp_files.pop(file_path, None)
+            files_to_remove.append(file_path)
+    
+    for file_path in files_to_remove:
+        try:
+            if os.path.exists(file_path):
+                os.unlink(file_path)
+                logger.info(f"Deleted expired file: {file_path}")
+        except Exception as e:
+            logger.error(f"Error deleting file {file_path}: {str(e)}")
+    
+    return len(files_to_remove)
 
 
 def cleanup_expired_files():
     """
     Clean up temporary files that are older than the expiry time.
-    This function runs in a background thread and periodically checks for and deletes expired files.
+    This function runs in a background thread. It scans the temporary directory once
+    to delete or track files left by previous runs, then sleeps until the next tracked
+    file expires.
     """
-    while True:
+    # Delete or track files left behind by previous runs
+    cleanup_untracked_files()
+    cleanup_cache_files()
+    
+    while not _cleanup_stop.is_set():
         try:
-            current_time = datetime.datetime.now()
-            files_to_remove = []
+            # Sleep until the earliest tracked file expires or the thread is stopped
+            with temp_files_lock:
+                while not _cleanup_stop.is_set():
+                    timeout = expiry_heap[0][0] - time.time() if expiry_heap else None
+                    if timeout is not None and timeout <= 0:
+                        break
+                    temp_files_lock.wait(timeout)
             
-            # Check all tracked files
-            for file_path, creation_time in list(temp_files.items()):
-                time_diff = current_time - creation_time
-                # Check if file is older than expiry time
-                if time_diff.total_seconds() > FILE_EXPIRY_HOURS * 3600:
-                    try:
-                        if os.path.exists(file_path):
-                            os.unlink(file_path)
-                            logger.info(f"Deleted expired file: {file_path}")
-                        files_to_remove.append(file_path)
-                    except Exception as e:
-                        logger.error(f"Error deleting file {file_path}: {str(e)}")
-            
-            # Remove deleted files from tracking dict
-            for file_path in files_to_remove:
-                temp_files.pop(file_path, None)
-                
-            # Also clean up any files in the temp directory that are not being tracked
-            cleanup_untracked_files(current_time)
-                
+            remove_expired_files()
         except Exception as e:
             logger.error(f"Error in cleanup thread: {str(e)}")
+            _cleanup_stop.wait(60)
+
+
+def _sweep_directory(directory, current_time, description):
+    """
+    Delete untracked expired files in a directory and track the rest.
+    Files left by previous runs that have not expired yet are put on the expiry
+    heap, so they are deleted once they do.
+    
+    Args:
+        directory (Path): Directory to sweep
+        current_time (float): Current time in epoch seconds
+        description (str): What the files are, for log messages
+    """
+    threshold = current_time - FILE_EXPIRY_HOURS * 3600
+    
+    # Snapshot the tracked paths once instead of probing the shared dict per entry
+    with temp_files_lock:
+        tracked_paths = set(temp_files)
         
-        # Sleep for 15 minutes before next cleanup
-        time.sleep(15 * 60)
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.path in tracked_paths or not entry.is_file(follow_symlinks=False):
+                    continue
+                modified_time = entry.stat(follow_symlinks=False).st_mtime
+                if modified_time >= threshold:
+                    track_temp_file(entry.path, modified_time)
+                    continue
+                try:
+                    os.unlink(entry.path)
+                    logger.info(f"Deleted expired {description}: {entry.path}")
+                except Exception as e:
+                    logger.error(f"Error deleting {description} {entry.path}: {str(e)}")
+    except Exception as e:
+        logger.error(f"Error cleaning up {directory}: {str(e)}")
 
 
 def cleanup_untracked_files(current_time=None):
     """
     Clean up untracked files in the temporary directory.
+    Untracked files that have not expired yet are tracked from their modification time.
     
     Args:
-        current_time (datetime, optional): Current time. If None, uses datetime.now().
+        current_time (float, optional): Current time in epoch seconds. If None, uses time.time().
     """
     if current_time is None:
-        current_time = datetime.datetime.now()
-        
-    try:
-        for file_path in TEMP_DIR.glob("*"):
-            if str(file_path) not in temp_files and file_path.is_file():
-                creation_time = datetime.datetime.fromtimestamp(file_path.stat().st_mtime)
-                time_diff = current_time - creation_time
-                if time_diff.total_seconds() > FILE_EXPIRY_HOURS * 3600:
-                    try:
-                        file_path.unlink()
-                        logger.info(f"Deleted untracked expired file: {file_path}")
-                    except Exception as e:
-                        logger.error(f"Error deleting untracked file {file_path}: {str(e)}")
-    except Exception as e:
-        logger.error(f"Error cleaning up directory: {str(e)}")
+        current_time = time.time()
+    _sweep_directory(TEMP_DIR, current_time, "untracked file")
+
+
+def cleanup_cache_files(current_time=None):
+    """
+    Clean up conversion cache entries older than the expiry time.
+    Untracked entries that have not expired yet are tracked from their modification time.
+    
+    Args:
+        current_time (float, optional): Current time in epoch seconds. If None, uses time.time().
+    """
+    if current_time is None:
+        current_time = time.time()
+    _sweep_directory(CACHE_DIR, current_time, "cache entry")
 
 
 def is_file_expired(file_path, expiry_hours=None):
@@ -87,17 +165,10 @@ def is_file_expired(file_path, expiry_hours=None):
         expiry_hours = FILE_EXPIRY_HOURS
         
     try:
-        if not os.path.exists(file_path):
-            return False
-            
-        # Get file stats
-        file_stat = os.stat(file_path)
-        creation_time = datetime.datetime.fromtimestamp(file_stat.st_mtime)
-        current_time = datetime.datetime.now()
-        
         # Check if file has expired
-        time_diff = current_time - creation_time
-        return time_diff.total_seconds() > expiry_hours * 3600
+        return time.time() - os.stat(file_path).st_mtime > expiry_hours * 3600
+    except FileNotFoundError:
+        return False
     except Exception as e:
         logger.error(f"Error checking file expiry: {str(e)}")
         return False
@@ -106,11 +177,45 @@ def is_file_expired(file_path, expiry_hours=None):
 def start_cleanup_thread():
     """
     Start the background cleanup thread.
+    Streamlit reruns the app script on every interaction, so the thread is only
+    started once per process. It is stopped on interpreter shutdown instead of
+    being killed mid-sweep.
+    """
+    global _cleanup_thread, _atexit_registered
+    with _cleanup_thread_lock:
+        if _cleanup_thread is None or not _cleanup_thread.is_alive():
+            _cleanup_stop.clear()
+            _cleanup_thread = threading.Thread(target=cleanup_expired_files, daemon=True)
+            _cleanup_thread.start()
+            logger.info("Started cleanup thread")
+            if not _atexit_registered:
+                atexit.register(stop_cleanup_thread, 5)
+                _atexit_registered = True
+    return _cleanup_thread
+
+
+def stop_cleanup_thread(timeout=None):
+    """
+    Stop the background cleanup thread.
+    The thread is woken immediately rather than at the next expiry.
+    
+    Args:
+        timeout (float, optional): Seconds to wait for the thread to exit. If None, waits until it does.
     """
-    cleanup_thread = threading.Thread(target=cleanup_expired_files, daemon=True)
-    cleanup_thread.start()
-    logger.info("Started cleanup thread")
-    return cleanup_thread
+    with _cleanup_thread_lock:
+        if _cleanup_thread is None or not _cleanup_thread.is_alive():
+            return
+        
+        _cleanup_stop.set()
+        with temp_files_lock:
+            temp_files_lock.notify_all()
+        
+        _cleanup_thread.join(timeout)
+        if _cleanup_thread.is_alive():
+            logger.warning("Cleanup thread did not stop in time")
+        else:
+            logger.info("Stopped cleanup thread")
+
 
 
 def manual_cleanup():
@@ -118,27 +223,12 @@ def manual_cleanup():
     Manually trigger a cleanup of expired files.
     """
     logger.info("Manual cleanup triggered")
-    current_time = datetime.datetime.now()
-    files_to_remove = []
-    
-    # Check tracked files
-    for file_path, creation_time in list(temp_files.items()):
-        time_diff = current_time - creation_time
-        if time_diff.total_seconds() > FILE_EXPIRY_HOURS * 3600:
-            try:
-                if os.path.exists(file_path):
-                    os.unlink(file_path)
-                    logger.info(f"Manually deleted expired file: {file_path}")
-                files_to_remove.append(file_path)
-            except Exception as e:
-                logger.error(f"Error deleting file during manual cleanup {file_path}: {str(e)}")
-    
-    # Remove deleted files from tracking dict
-    for file_path in files_to_remove:
-        temp_files.pop(file_path, None)
+    removed_count = remove_expired_files()
     
     # Cleanup untracked files
-    cleanup_untracked_files(current_time)
+    cleanup_untracked_files()
     
-    return len(files_to_remove)
-
+    # Cleanup stale cache entries
+    cleanup_cache_files()
+    
+    return removed_count
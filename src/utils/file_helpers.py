@@ -3,52 +3,52 @@ File handling utilities for the Markdown Converter UI.
 """
 
 import os
-import base64
-import uuid
-import datetime
+import secrets
+import itertools
 from pathlib import Path
 
 import streamlit as st
 
-from src.config import TEMP_DIR, MAX_FILE_SIZE_MB, temp_files, logger
+from src.config import TEMP_DIR, MAX_FILE_SIZE_MB, logger
+from src.utils.cleanup import track_temp_file
 
+# Per-process prefix and counter used to build short unique temp file names
+_temp_file_prefix = secrets.token_hex(3)
+_temp_file_counter = itertools.count()
 
-def get_download_link(content, filename, text):
+# Units for format_file_size, from largest to smallest
+_SIZE_UNITS = (("GB", 1 << 30), ("MB", 1 << 20), ("KB", 1 << 10))
+
+
+def format_file_size(size_bytes):
     """
-    Generate a download link for the content.
+    Format file size in a human-readable format.
     
     Args:
-        content (str): The markdown content to be downloaded
-        filename (str): The name of the file to be downloaded
-        text (str): The text to display for the download link
+        size_bytes (int): Size in bytes
     
     Returns:
-        str: HTML for the download link
+        str: Formatted file size (e.g., "5.2 MB")
     """
-    try:
-        b64 = base64.b64encode(content.encode()).decode()
-        return f'<a href="data:text/plain;base64,{b64}" download="{filename}" class="download-button">{text}</a>'
-    except Exception as e:
-        logger.error(f"Error generating download link: {str(e)}")
-        return f'<a href="#" class="download-button error">Error: {str(e)}</a>'
+    for unit, scale in _SIZE_UNITS:
+        if size_bytes >= scale:
+            return f"{size_bytes / scale:.1f} {unit}"
+    return f"{size_bytes} bytes"
 
 
-def format_file_size(size_bytes):
+def get_file_extension(file_name):
     """
-    Format file size in a human-readable format.
+    Get the lower-cased extension of a file name, without the leading dot.
+    Dot-files such as ".md" have no extension.
     
     Args:
-        size_bytes (int): Size in bytes
+        file_name (str): The name of the file
     
     Returns:
-        str: Formatted file size (e.g., "5.2 MB")
+        str: The file extension, or an empty string if there is none
     """
-    if size_bytes < 1024:
-        return f"{size_bytes} bytes"
-    elif size_bytes < 1024 * 1024:
-        return f"{size_bytes / 1024:.1f} KB"
-    else:
-        return f"{size_bytes / (1024 * 1024):.1f} MB"
+    stem, _, ext = file_name.rpartition('.')
+    return ext.lower() if stem.lstrip('.') else ""
 
 
 def save_uploaded_file(uploaded_file):
@@ -64,23 +64,23 @@ def save_uploaded_file(uploaded_file):
     """
     try:
         # Check file size
-        file_size = len(uploaded_file.getvalue())
+        file_size = uploaded_file.size
         if file_size > MAX_FILE_SIZE_MB * 1024 * 1024:
             st.error(f"File exceeds size limit of {MAX_FILE_SIZE_MB}MB. Your file is {file_size / (1024 * 1024):.1f}MB.")
             return None
             
         # Create a unique filename
-        unique_id = str(uuid.uuid4())
-        file_ext = os.path.splitext(uploaded_file.name)[1]
-        temp_file_name = f"{unique_id}{file_ext}"
+        unique_id = f"{_temp_file_prefix}{next(_temp_file_counter):x}"
+        file_ext = get_file_extension(uploaded_file.name)
+        temp_file_name = f"{unique_id}.{file_ext}" if file_ext else unique_id
         temp_file_path = os.path.join(TEMP_DIR, temp_file_name)
         
-        # Save the file
-        with open(temp_file_path, 'wb') as f:
-            f.write(uploaded_file.getvalue())
+        # Save the file straight from the upload's in-memory buffer (no copy)
+        with open(temp_file_path, 'wb') as f, uploaded_file.getbuffer() as buffer:
+            f.write(buffer)
         
         # Track the file for cleanup
-        temp_files[temp_file_path] = datetime.datetime.now()
+        track_temp_file(temp_file_path)
         logger.info(f"Created temporary file: {temp_file_path}")
         
         return temp_file_path
@@ -96,13 +96,12 @@ def validate_file_type(file_name, accepted_types):
     
     Args:
         file_name (str): The name of the file
-        accepted_types (list): List of accepted file extensions
+        accepted_types (frozenset): Set of accepted file extensions, e.g. ACCEPTED_FILE_TYPES
     
     Returns:
         bool: True if the file type is accepted, False otherwise
     """
-    ext = os.path.splitext(file_name)[1].lower().lstrip('.')
-    return ext in accepted_types
+    return get_file_extension(file_name) in accepted_types
 
 
 def get_output_filename(input_filename):
@@ -115,5 +114,6 @@ def get_output_filename(input_filename):
     Returns:
         str: The name of the output markdown file
     """
-    return os.path.splitext(input_filename)[0] + ".md"
+    stem = input_filename.rpartition('.')[0]
+    return (stem if stem.lstrip('.') else input_filename) + ".md"
 
@@ -4,28 +4,67 @@ Markdown conversion utilities for the Markdown Converter UI.
 
 import os
 import streamlit as st
-from markitdown import MarkItDown, FileConversionException, DocumentConverterResult
+from markitdown import MarkItDown, FileConversionException
 
 from src.config import MAX_FILE_SIZE_MB, logger
 
 
-def convert_to_markdown(file_path, options=None, status_placeholder=None, progress_bar=None):
+@st.cache_resource
+def get_converter():
+    """
+    Get the shared MarkItDown converter.
+    The converter is stateless between conversions, so a single instance is
+    reused across files, reruns and sessions.
+
+    Returns:
+        MarkItDown: Converter with built-ins enabled
+    """
+    return MarkItDown(enable_builtins=True)
+
+
+def get_large_file_warning(file_size):
+    """
+    Get the warning shown for files approaching the size limit.
+
+    Args:
+        file_size (int): Size of the file in bytes
+
+    Returns:
+        str: The warning message
+        None: If the file is not close to the limit
+    """
+    file_size_mb = file_size / (1024 * 1024)
+    if MAX_FILE_SIZE_MB * 0.7 < file_size_mb <= MAX_FILE_SIZE_MB:
+        return f"Large file detected ({file_size_mb:.1f}MB). Processing may take longer."
+    return None
+
+
+def convert_to_markdown(file_path, options=None, status_placeholder=None, progress_bar=None, file_size=None):
     """
     Convert a file to markdown using the MarkItDown library.
+    Errors are returned as well as written to the status placeholder, so callers
+    running the conversion off the script thread can display them themselves.
 
     Args:
         file_path (str): Path to the file to convert
         options (dict, optional): Conversion options. Defaults to None.
         status_placeholder (st.empty, optional): Status placeholder for updates. Defaults to None.
         progress_bar (st.progress, optional): Progress bar for visual feedback. Defaults to None.
+        file_size (int, optional): Size of the file in bytes, if already known.
+            Defaults to None, in which case it is read from the file system.
 
     Returns:
-        str: The converted markdown content
-        None: If conversion failed
+        tuple: (markdown_content, error_msg). markdown_content is None and error_msg
+            describes the failure if conversion failed; otherwise error_msg is None.
     """
+    def fail(error_msg):
+        if status_placeholder:
+            status_placeholder.error(error_msg)
+        return None, error_msg
+
     try:
-        # Create converter with built-ins explicitly enabled
-        converter = MarkItDown(enable_builtins=True)
+        # Reuse the shared converter with built-ins enabled
+        converter = get_converter()
 
         if status_placeholder:
             status_placeholder.text("Analyzing file...")
@@ -36,17 +75,17 @@ def convert_to_markdown(file_path, options=None, status_placeholder=None, progre
         conversion_kwargs = options if options else {}
 
         # Check file size
-        file_size_mb = os.path.getsize(file_path) / (1024 * 1024)
+        if file_size is None:
+            file_size = os.path.getsize(file_path)
+        file_size_mb = file_size / (1024 * 1024)
         logger.info(f"Processing file: {file_path} ({file_size_mb:.1f}MB)")
 
         if file_size_mb > MAX_FILE_SIZE_MB:
-            error_msg = f"File exceeds size limit of {MAX_FILE_SIZE_MB}MB. Your file is {file_size_mb:.1f}MB."
-            if status_placeholder:
-                status_placeholder.error(error_msg)
             logger.warning(f"File size limit exceeded: {file_path} ({file_size_mb:.1f}MB)")
-            return None
-        elif file_size_mb > MAX_FILE_SIZE_MB * 0.7:  # Warn if file is approaching limit
-            warning_msg = f"Large file detected ({file_size_mb:.1f}MB). Processing may take longer."
+            return fail(f"File exceeds size limit of {MAX_FILE_SIZE_MB}MB. Your file is {file_size_mb:.1f}MB.")
+
+        warning_msg = get_large_file_warning(file_size)
+        if warning_msg:
             if status_placeholder:
                 status_placeholder.warning(warning_msg)
             logger.info(warning_msg)
@@ -63,42 +102,34 @@ def convert_to_markdown(file_path, options=None, status_placeholder=None, progre
             if progress_bar:
                 progress_bar.progress(80)
         except Exception as e:
-            if status_placeholder:
-                status_placeholder.error(f"Error converting file: {str(e)}")
             logger.error(f"Error in file conversion: {str(e)}")
-            return None
+            return fail(f"Error converting file: {str(e)}")
 
         # Get markdown content from result
-        markdown_content = None
-        if isinstance(result, DocumentConverterResult):
-            markdown_content = result.markdown
-        elif hasattr(result, 'markdown'):
-            markdown_content = result.markdown
-        elif hasattr(result, 'get_markdown'):
-            markdown_content = result.get_markdown()
-        elif isinstance(result, str):
-            markdown_content = result
-        else:
-            if status_placeholder:
-                status_placeholder.warning(f"Unexpected result type: {type(result)}")
-            markdown_content = str(result)
+        # (a DocumentConverterResult in practice, so its attribute is checked first)
+        markdown_content = getattr(result, 'markdown', None)
+        if markdown_content is None:
+            if isinstance(result, str):
+                markdown_content = result
+            elif callable(getattr(result, 'get_markdown', None)):
+                markdown_content = result.get_markdown()
+            else:
+                if status_placeholder:
+                    status_placeholder.warning(f"Unexpected result type: {type(result)}")
+                markdown_content = str(result)
 
-        if progress_bar:
-            progress_bar.progress(100)
         if status_placeholder:
             status_placeholder.text("Conversion complete!")
+        if progress_bar:
+            progress_bar.progress(100)
 
-        return markdown_content
+        return markdown_content, None
     except FileConversionException as e:
-        if status_placeholder:
-            status_placeholder.error(f"Conversion failed: {str(e)}")
         logger.error(f"FileConversionException: {str(e)}")
-        return None
+        return fail(f"Conversion failed: {str(e)}")
     except Exception as e:
-        if status_placeholder:
-            status_placeholder.error(f"Unexpected error: {str(e)}")
         logger.exception("Exception during file conversion")
-        return None
+        return fail(f"Unexpected error: {str(e)}")
 
 
 def render_markdown(markdown_text):
@@ -112,49 +143,10 @@ def render_markdown(markdown_text):
         bool: True if rendering was successful, False otherwise
     """
     try:
-        # Create a container to hold all markdown content
+        # Streamlit's markdown renderer handles fenced code blocks natively,
+        # so the whole document is sent as a single element
         with st.container():
-            # Process code blocks separately to ensure proper syntax highlighting
-            lines = markdown_text.split('\n')
-            in_code_block = False
-            code_block_content = []
-            language = ""
-            current_text = []
-
-            for line in lines:
-                if line.startswith('```'):
-                    if in_code_block:  # End of code block
-                        # Render accumulated text before code block
-                        if current_text:
-                            st.markdown('\n'.join(current_text))
-                            current_text = []
-
-                        # Render code block with syntax highlighting
-                        st.code('\n'.join(code_block_content), language=language)
-                        code_block_content = []
-                        language = ""
-                        in_code_block = False
-                    else:  # Start of code block
-                        # Render accumulated text
-                        if current_text:
-                            st.markdown('\n'.join(current_text))
-                            current_text = []
-
-                        # Extract language if specified
-                        language = line[3:].strip() if len(line) > 3 else ""
-                        in_code_block = True
-                elif in_code_block:
-                    code_block_content.append(line)
-                else:
-                    current_text.append(line)
-
-            # Render any remaining text
-            if current_text:
-                st.markdown('\n'.join(current_text))
-
-            # If we're still in a code block, render it
-            if in_code_block and code_block_content:
-                st.code('\n'.join(code_block_content), language=language)
+            st.markdown(markdown_text)
 
         return True
     except Exception as e: